@@ -2,6 +2,250 @@
 
 import configparser
 import datetime
+import logging
+import os
+import threading
+import types
+from typing import Mapping
+
+# parsed config files are shared between parser objects. The cache is keyed by the absolute path
+# and holds the modification time and size of the file so that a changed file is read again.
+_PARSED_CACHE = {}
+_PARSED_CACHE_LOCK = threading.Lock()
+
+_BOOLEAN_STATES = configparser.ConfigParser.BOOLEAN_STATES
+
+# returned for optional sections that are missing in the config file
+_EMPTY_SECTION = types.MappingProxyType({})
+
+# measurement types that can be switched on in the Data Usage section (in order of use)
+_MEASUREMENT_TYPES = ("batteries", "solar", "loads", "node")
+
+# names of the read functions (without the "read_" prefix) that are collected by read_all, with
+# the section they require (None if the section is optional)
+_READ_ALL_FUNCTIONS = (("batches", None), ("data_path", None), ("time_filters", None),
+                       ("sign_correction", None), ("duplicate_removal", None),
+                       ("data_usage", None), ("measurement_types", None), ("nan_handeling", None),
+                       ("resampling", None), ("refill", None),
+                       ("optimiser_objective_set", "Optimiser Objective Set"),
+                       ("optimiser_objectives", None), ("inverter", "Inverter"),
+                       ("energy_storage", "EnergyStorage"), ("energy_system", "EnergySystem"),
+                       ("tariff_factors", "TariffFactors"), ("scenario_info", None))
+
+# keys that are typecasted per section, all other values are kept as strings
+_SECTION_SCHEMAS = {
+    "Batches": {"ints": ("number_of_batches", "concat_batches_start", "concat_batches_end",
+                         "files_per_batch")},
+    "Time Filter": {"bools": ("time_filter_use",)},
+    "Sign Correction": {"bools": ("wrong_sign_removal",)},
+    "Duplicate Removal": {"bools": ("duplicate_removal",)},
+    "Nan handling": {"bools": ("nan_removal",)},
+    "Data Usage": {"bools": _MEASUREMENT_TYPES},
+    "Resample": {"ints": ("resampling_step",),
+                 "bools": ("resampling",)},
+    "Refill": {"ints": ("days", "attempts", "threshold"),
+               "bools": ("data_refill", "forward_fill", "backward_fill")},
+    "Optimiser Objectives": {"bools": ("ConnectionPointCost", "ConnectionPointEnergy",
+                                       "ThroughputCost", "Throughput", "GreedyGenerationCharging",
+                                       "GreedyDemandDischarging", "EqualStorageActions",
+                                       "ConnectionPointPeakPower", "ConnectionPointQuantisedPeak",
+                                       "PiecewiseLinear", "LocalModelsCost", "LocalGridMinimiser",
+                                       "LocalThirdParty", "LocalGridPeakPower")},
+    "Inverter": {"floats": ("charging_power_limit", "discharging_power_limit",
+                            "charging_efficiency", "discharging_efficiency",
+                            "charging_reactive_power_limit", "discharging_reactive_power_limit",
+                            "reactive_charging_efficiency", "reactive_discharging_efficiency")},
+    "EnergyStorage": {"floats": ("max_capacity", "depth_of_discharge_limit",
+                                 "charging_power_limit", "discharging_power_limit",
+                                 "charging_efficiency", "discharging_efficiency",
+                                 "throughput_cost", "initial_state_of_charge")},
+    "EnergySystem": {"bools": ("energy_storage", "inverter", "generation", "is_hybrid")},
+    "TariffFactors": {"floats": ("lt_import_factor", "lt_export_factor", "rt_export_factor",
+                                 "rt_import_factor", "subscription_fee")},
+}
+
+logger = logging.getLogger(__name__)
+
+
+def _typed_section(section_dict: dict, ints=(), floats=(), bools=()) -> dict:
+    """Typecasts values of a section in a single pass over the given keys.
+
+    Keys are looked up the way configparser stores them (lower case), missing integers and floats
+    are set to None and missing booleans to False.
+
+    Args:
+        section_dict (dict): raw (string) values of a section, typecasted in place.
+        ints (tuple): keys to be converted to int.
+        floats (tuple): keys to be converted to float.
+        bools (tuple): keys to be converted to bool.
+
+    Returns:
+        section_dict (dict): dictionary with the typecasted values of the section.
+    """
+    get_value = section_dict.get
+    boolean_states = _BOOLEAN_STATES
+
+    for key in ints:
+        value = get_value(key.lower())
+        section_dict[key] = int(value) if value is not None else None
+
+    for key in floats:
+        value = get_value(key.lower())
+        section_dict[key] = float(value) if value is not None else None
+
+    for key in bools:
+        value = get_value(key.lower())
+        if value is None:
+            section_dict[key] = False
+        elif value.lower() in boolean_states:
+            section_dict[key] = boolean_states[value.lower()]
+        else:
+            raise ValueError("Not a boolean: %s" % value)
+
+    return section_dict
+
+
+def _typecast_section(section: str, raw_section: dict) -> dict:
+    """Converts a section read from the config file to a typecasted dictionary.
+
+    Args:
+        section (str): name of the section in the config file.
+        raw_section (dict): raw (string) values of the section.
+
+    Returns:
+        section_dict (dict): dictionary with the typecasted values of the section.
+    """
+    section_dict = dict(raw_section)
+
+    if section_dict and section in _SECTION_SCHEMAS:
+        _typed_section(section_dict, **_SECTION_SCHEMAS[section])
+
+    if section == "Time Filter" and section_dict.get("time_filter_use"):
+        section_dict["start_time"] = datetime.datetime.strptime(section_dict["start_time"],
+                                                                "%Y-%m-%d %H:%M")
+        section_dict["end_time"] = datetime.datetime.strptime(section_dict["end_time"],
+                                                              "%Y-%m-%d %H:%M")
+
+    return section_dict
+
+
+def _parse_config(ini_path: str) -> dict:
+    """Reads a config file into a dictionary of sections. Values are not typecasted.
+
+    The file is read line by line in a single pass. The format follows the defaults of
+    configparser as far as they are used by the config files of this package:
+    - lines starting with # or ; are comments, inline comments are kept as part of the value
+    - keys and values are separated by the first = or :
+    - keys are stored in lower case, keys and values are stripped of whitespace
+    - indented lines continue the value of the previous key, empty lines within such a value are
+      kept, trailing ones are dropped
+    - a section or a key that is repeated raises DuplicateSectionError / DuplicateOptionError
+    - values of a DEFAULT section are added to every other section
+    Interpolation (e.g. %(key)s) is not supported.
+
+    Args:
+        ini_path (str): string to the config file.
+
+    Returns:
+        sections (dict): dictionary with one dictionary of raw values per section.
+    """
+    sections = {}
+    defaults = {}
+    section_dict = None
+    name = None
+    key = None
+    # empty lines after a value, they are only added if another continuation line follows
+    empty_lines = 0
+
+    try:
+        # a 64 KiB read buffer keeps the number of read calls low for large config files
+        config_file = open(ini_path, 'r', encoding='utf-8', buffering=1 << 16)
+    except OSError:
+        # same as configparser, files that can't be read are ignored
+        return sections
+
+    with config_file:
+        for line_number, line in enumerate(config_file, start=1):
+            stripped = line.strip()
+
+            if not stripped:
+                empty_lines += 1
+                continue
+
+            if stripped[0] in "#;":
+                continue
+
+            if line[0].isspace() and key is not None:
+                section_dict[key] += "\n" * (empty_lines + 1) + stripped
+                empty_lines = 0
+                continue
+
+            empty_lines = 0
+
+            if stripped[0] == "[" and "]" in stripped:
+                name = stripped[1:stripped.rindex("]")]
+                if name == "DEFAULT":
+                    section_dict = defaults
+                elif name in sections:
+                    raise configparser.DuplicateSectionError(name, ini_path, line_number)
+                else:
+                    section_dict = sections[name] = {}
+                key = None
+                continue
+
+            if section_dict is None:
+                raise configparser.MissingSectionHeaderError(ini_path, line_number, line)
+
+            equals = stripped.find("=")
+            colon = stripped.find(":")
+            if equals == -1 or -1 < colon < equals:
+                equals = colon
+            if equals <= 0:
+                error = configparser.ParsingError(ini_path)
+                error.append(line_number, line)
+                raise error
+
+            key = stripped[:equals].strip().lower()
+            if key in section_dict:
+                raise configparser.DuplicateOptionError(name, key, ini_path, line_number)
+            section_dict[key] = stripped[equals + 1:].strip()
+
+    if defaults:
+        for name, section_dict in sections.items():
+            sections[name] = dict(defaults, **section_dict)
+
+    return sections
+
+
+def _read_config(ini_path: str) -> dict:
+    """Returns the sections of a config file, the file is only parsed again if it has been changed
+    since it was last read.
+
+    Args:
+        ini_path (str): string to the config file.
+
+    Returns:
+        sections (dict): dictionary with one dictionary of raw values per section.
+    """
+    try:
+        stat = os.stat(ini_path)
+    except OSError:
+        # configparser ignores files that can't be read, nothing worth caching
+        return _parse_config(ini_path)
+
+    key = os.path.abspath(ini_path)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+
+    with _PARSED_CACHE_LOCK:
+        cached = _PARSED_CACHE.get(key)
+    if cached is not None and cached[0] == file_version:
+        return cached[1]
+
+    sections = _parse_config(ini_path)
+    with _PARSED_CACHE_LOCK:
+        _PARSED_CACHE[key] = (file_version, sections)
+
+    return sections
 
 
 class ConfigFileParser:
@@ -9,6 +253,10 @@ class ConfigFileParser:
     Data Usage, Time Filter, Sign Correction, Duplicate Removal, Nan handling and Resample and so on.
     Each of these section can be read separately and the used as parameters for various functions
 
+    The config file is parsed exactly once, when the object is created. Parsers created for the
+    same (unchanged) file share the parsed sections. A section is only typecasted when it is
+    read for the first time. Sections are returned as read-only mappings
+    (types.MappingProxyType) that can be shared safely, use dict(...) to get a modifiable copy.
     """
 
     def __init__(self, ini_path: str):
@@ -20,11 +268,28 @@ class ConfigFileParser:
         """
 
         self.ini_path = ini_path
-        self.ini_path = ini_path
-        self.config = configparser.ConfigParser()
-        self.config.read(self.ini_path)
+        self._raw_sections = _read_config(self.ini_path)
+        self._cache = {}
+
+    def _section(self, section: str, optional: bool = False) -> Mapping:
+        """Returns the typecasted values of a section, the section is converted on first use.
+
+        Args:
+            section (str): name of the section in the config file.
+            optional (bool, False): if the section is optional an empty mapping is returned when
+                the config file doesn't contain it, otherwise a KeyError is raised.
 
-    def read_batches(self) -> dict:
+        Returns:
+            section_dict (Mapping): read-only view of the typecasted values of the section.
+        """
+        if section not in self._cache:
+            if optional and section not in self._raw_sections:
+                return _EMPTY_SECTION
+            self._cache[section] = types.MappingProxyType(
+                _typecast_section(section, self._raw_sections[section]))
+        return self._cache[section]
+
+    def read_batches(self) -> Mapping:
         """Reads the batch section from config file and converts it to a dictionary that is
         typecasted.
 
@@ -37,17 +302,11 @@ class ConfigFileParser:
             batches_dict (dict): Dictionary with configuration values for file batching
         """
 
-        batches_dict = dict(self.config.items('Batches')) if "Batches" in self.config else {}
-        if batches_dict:
-            batches_dict["number_of_batches"] = self.config["Batches"].getint("number_of_batches")
-            batches_dict["concat_batches_start"] = \
-                self.config["Batches"].getint("concat_batches_start")
-            batches_dict["concat_batches_end"] = self.config["Batches"].getint("concat_batches_end")
-            batches_dict["files_per_batch"] = self.config["Batches"].getint("files_per_batch")
-        print("batches dict: ", batches_dict)
+        batches_dict = self._section("Batches", optional=True)
+        logger.debug("batches dict: %s", batches_dict)
         return batches_dict
 
-    def read_data_path(self) -> dict:
+    def read_data_path(self) -> Mapping:
         """Reads the "Data Path" section from config file and converts it to a dictionary.
 
         Possible values for this section are (key:value)
@@ -62,40 +321,29 @@ class ConfigFileParser:
             data_path_dict (dict): Dictionary with configuration values for file batching
 
         """
-        data_path_dict = dict(self.config.items('Data Path')) if "Data Path" in self.config else {}
-        print("datapath: ", data_path_dict)
+        data_path_dict = self._section("Data Path", optional=True)
+        logger.debug("datapath: %s", data_path_dict)
         return data_path_dict
 
-    def read_time_filters(self) -> dict:
+    def read_time_filters(self) -> Mapping:
         """Reads the Time Filter section from config file and converts it to a dictionary that is
-        typecasted. Timestamps are unix times.
+        typecasted. If the filter is used, start and end time are converted to (naive)
+        datetime.datetime objects.
 
         Variables read into the dictionary (key:value)
             time_filter_use: True/False
-            start_time: 1/1/2018 00:00:00
-            end_time: 31/12/2018 23:59:59
+            start_time: 2018-1-1 00:00
+            end_time: 2018-12-31 23:59
 
         Returns:
             time_filter_dict (dict): dictionary with configuration values for time filtering
         """
 
-        time_filter_dict = dict(self.config.items("Time Filter")) \
-            if "Time Filter" in self.config else {}
-
-        if time_filter_dict:
-            time_filter_dict["time_filter_use"] = \
-                self.config["Time Filter"].getboolean("time_filter_use", fallback=False)
-
-            if time_filter_dict["time_filter_use"]:
-                time_filter_dict["start_time"] = datetime.datetime.strptime(
-                    time_filter_dict["start_time"], "%Y-%m-%d %H:%M")
-                time_filter_dict["end_time"] = datetime.datetime.strptime(
-                    time_filter_dict["end_time"], "%Y-%m-%d %H:%M")
-
-        print("time filter: ", time_filter_dict)
+        time_filter_dict = self._section("Time Filter", optional=True)
+        logger.debug("time filter: %s", time_filter_dict)
         return time_filter_dict
 
-    def read_sign_correction(self) -> dict:
+    def read_sign_correction(self) -> Mapping:
         """Reads the Sign Correction section from config file and converts it to a dictionary
         that is typecasted.
 
@@ -109,16 +357,11 @@ class ConfigFileParser:
             sign_correction_dict (dict): dictionary with configuration values for sign correction
         """
 
-        sign_correction_dict = dict(self.config.items("Sign Correction")) \
-            if "Sign Correction" in self.config else {}
-        if sign_correction_dict:
-            sign_correction_dict["wrong_sign_removal"] = \
-                self.config["Sign Correction"].getboolean("wrong_sign_removal", fallback=False)
-
-        print("sign correction: ", sign_correction_dict)
+        sign_correction_dict = self._section("Sign Correction", optional=True)
+        logger.debug("sign correction: %s", sign_correction_dict)
         return sign_correction_dict
 
-    def read_duplicate_removal(self) -> dict:
+    def read_duplicate_removal(self) -> Mapping:
         """Reads the duplicate Removal section from config file and converts it to a dictionary that
         is type casted.
 
@@ -132,17 +375,11 @@ class ConfigFileParser:
             duplicate_removal_dict (dict): dictionary with configuration values for
             duplicate removal
         """
-        duplicate_removal_dict = dict(self.config.items("Duplicate Removal")) \
-            if "Duplicate Removal" in self.config else {}
-
-        if duplicate_removal_dict:
-            duplicate_removal_dict["duplicate_removal"] = \
-                self.config["Duplicate Removal"].getboolean("duplicate_removal", fallback=False)
-
-        print("Duplicate Removal: ", duplicate_removal_dict)
+        duplicate_removal_dict = self._section("Duplicate Removal", optional=True)
+        logger.debug("Duplicate Removal: %s", duplicate_removal_dict)
         return duplicate_removal_dict
 
-    def read_nan_handeling(self) -> dict:
+    def read_nan_handeling(self) -> Mapping:
         """Reads the nan handling section from config file and converts it to a dictionary that is
         typecasted.
 
@@ -155,14 +392,8 @@ class ConfigFileParser:
         Returns:
             nan_handling_dict (dict): dictionary with configuration values for nan handling
         """
-        nan_handling_dict = dict(self.config.items("Nan handling")) \
-            if "Nan handling" in self.config else {}
-
-        if nan_handling_dict:
-            nan_handling_dict["nan_removal"] = \
-                self.config["Nan handling"].getboolean("nan_removal", fallback=False)
-
-        print("Nan handling: ", nan_handling_dict)
+        nan_handling_dict = self._section("Nan handling", optional=True)
+        logger.debug("Nan handling: %s", nan_handling_dict)
         return nan_handling_dict
 
     def read_data_usage(self) -> list:
@@ -176,26 +407,17 @@ class ConfigFileParser:
         - loads = True/False
 
         Returns:
-            measurement_types_list (list): a list with measurement types to be used
+            measurement_types_list (list): a new list with measurement types to be used
         """
-        measurement_types_list = []
-        measurement_type_dict = dict(self.config.items("Data Usage")) \
-            if "Data Usage" in self.config else {}
-
-        if measurement_type_dict:
-            if self.config["Data Usage"].getboolean("batteries", fallback=False):
-                measurement_types_list.append("batteries")
-            if self.config["Data Usage"].getboolean("solar", fallback=False):
-                measurement_types_list.append("solar")
-            if self.config["Data Usage"].getboolean("loads", fallback=False):
-                measurement_types_list.append("loads")
-            if self.config["Data Usage"].getboolean("node", fallback=False):
-                measurement_types_list.append("node")
-
-        print("Measurement Type list : ", measurement_types_list)
+        measurement_type_dict = self._section("Data Usage", optional=True)
+
+        measurement_types_list = [measurement_type for measurement_type in _MEASUREMENT_TYPES
+                                  if measurement_type_dict.get(measurement_type)]
+
+        logger.debug("Measurement Type list : %s", measurement_types_list)
         return measurement_types_list
 
-    def read_measurement_types(self) -> list:
+    def read_measurement_types(self) -> Mapping:
         """Reads the Data Usage section from config file and converts it to a dictionary of measurement
         types that should be used.
 
@@ -206,20 +428,13 @@ class ConfigFileParser:
         - loads = True/False
 
         Returns:
-            measurement_types_dict (dict): a list with measurement types to be used
+            measurement_types_dict (dict): a dictionary with measurement types to be used
         """
-        measurement_type_dict = dict(self.config.items("Data Usage")) \
-            if "Data Usage" in self.config else {}
-
-        if measurement_type_dict:
-            measurement_type_dict["batteries"] = self.config["Data Usage"].getboolean("batteries", fallback=False)
-            measurement_type_dict["solar"] = self.config["Data Usage"].getboolean("solar", fallback=False)
-            measurement_type_dict["loads"] = self.config["Data Usage"].getboolean("loads", fallback=False)
-
-        print("Measurement Type list : ", measurement_type_dict)
+        measurement_type_dict = self._section("Data Usage", optional=True)
+        logger.debug("Measurement Type list : %s", measurement_type_dict)
         return measurement_type_dict
 
-    def read_resampling(self) -> dict:
+    def read_resampling(self) -> Mapping:
         """Reads the resample section from config file and converts it to a dictionary that is type
         casted.
 
@@ -237,20 +452,11 @@ class ConfigFileParser:
         - resampeling_unit = m
         - resampeling_strategie_upsampeling = first/last
         """
-        resampling_dict = dict(self.config.items("Resample")) if "Resample" in self.config else {}
-
-        if resampling_dict:
-            resampling_dict["resampling"] = \
-                self.config["Resample"].getboolean("resampling", fallback=False)
-
-            resampling_dict["resampling_step"] = \
-                self.config["Resample"].getint("resampling_step")
-
-        print("resampling : ", type(resampling_dict), resampling_dict)
+        resampling_dict = self._section("Resample", optional=True)
+        logger.debug("resampling : %s", resampling_dict)
         return resampling_dict
 
-
-    def read_refill(self) -> dict:
+    def read_refill(self) -> Mapping:
         """Reads the refill section from config file and converts it to a dictionary that is
         typecasted.
 
@@ -265,21 +471,8 @@ class ConfigFileParser:
         Returns:
             refill_dict (dict): dictionary with configuration values for refilling data
         """
-        refill_dict = dict(self.config.items("Refill")) \
-            if "Refill" in self.config else {}
-
-        if refill_dict:
-            refill_dict["data_refill"] = self.config["Refill"].getboolean("data_refill",
-                                                                          fallback=False)
-            refill_dict["forward_fill"] = self.config["Refill"].getboolean("forward_fill",
-                                                                           fallback=False)
-            refill_dict["backward_fill"] = self.config["Refill"].getboolean("backward_fill",
-                                                                            fallback=False)
-            refill_dict["days"] = self.config["Refill"].getint("days")
-            refill_dict["attempts"] = self.config["Refill"].getint("attempts")
-            refill_dict["threshold"] = self.config["Refill"].getint("threshold")
-
-        print("Refill: ", refill_dict)
+        refill_dict = self._section("Refill", optional=True)
+        logger.debug("Refill: %s", refill_dict)
         return refill_dict
 
     def read_optimiser_objective_set(self) -> str:
@@ -288,127 +481,91 @@ class ConfigFileParser:
             Returns:
                 String with name of the optimiser set to be used
         """
-        optimiser_set_dict = dict(self.config.items("Optimiser Objective Set"))\
-            if "Optimiser Objective Set" in self.config else {}
+        optimiser_set_dict = self._section("Optimiser Objective Set", optional=True)
 
         optimiser_set_name = optimiser_set_dict["optimiserobjectiveset"]
 
-        print("optimiser set: ", optimiser_set_name)
+        logger.debug("optimiser set: %s", optimiser_set_name)
         return optimiser_set_name
 
-    def read_optimiser_objectives(self) -> list:
+    def read_optimiser_objectives(self) -> Mapping:
         """ Reads the optimiser objectives from config file.
 
             Returns:
-                List with name of the objectives choosen to be used
+                dict with the objectives and whether they are choosen to be used
         """
-        optimiser_objectives_dict = dict(self.config.items("Optimiser Objectives"))\
-            if "Optimiser Objectives" in self.config else {}
-
-        if optimiser_objectives_dict:
-            optimiser_objectives_dict["ConnectionPointCost"] = self.config["Optimiser Objectives"].getboolean("ConnectionPointCost", fallback=False)
-            optimiser_objectives_dict["ConnectionPointEnergy"] = self.config["Optimiser Objectives"].getboolean("ConnectionPointEnergy", fallback=False)
-            optimiser_objectives_dict["ThroughputCost"] = self.config["Optimiser Objectives"].getboolean("ThroughputCost", fallback=False)
-            optimiser_objectives_dict["Throughput"] = self.config["Optimiser Objectives"].getboolean("Throughput", fallback=False)
-            optimiser_objectives_dict["GreedyGenerationCharging"] = self.config["Optimiser Objectives"].getboolean("GreedyGenerationCharging", fallback=False)
-            optimiser_objectives_dict["GreedyDemandDischarging"] = self.config["Optimiser Objectives"].getboolean("GreedyDemandDischarging", fallback=False)
-            optimiser_objectives_dict["EqualStorageActions"] = self.config["Optimiser Objectives"].getboolean("EqualStorageActions", fallback=False)
-            optimiser_objectives_dict["ConnectionPointPeakPower"] = self.config["Optimiser Objectives"].getboolean("ConnectionPointPeakPower", fallback=False)
-            optimiser_objectives_dict["ConnectionPointQuantisedPeak"] = self.config["Optimiser Objectives"].getboolean("ConnectionPointQuantisedPeak", fallback=False)
-            optimiser_objectives_dict["PiecewiseLinear"] = self.config["Optimiser Objectives"].getboolean("PiecewiseLinear", fallback=False)
-            optimiser_objectives_dict["LocalModelsCost"] = self.config["Optimiser Objectives"].getboolean("LocalModelsCost", fallback=False)
-            optimiser_objectives_dict["LocalGridMinimiser"] = self.config["Optimiser Objectives"].getboolean("LocalGridMinimiser", fallback=False)
-            optimiser_objectives_dict["LocalThirdParty"] = self.config["Optimiser Objectives"].getboolean("LocalThirdParty", fallback=False)
-            optimiser_objectives_dict["LocalGridPeakPower"] = self.config["Optimiser Objectives"].getboolean("LocalGridPeakPower", fallback=False)
-
-        print("Objectives: ", optimiser_objectives_dict)
+        optimiser_objectives_dict = self._section("Optimiser Objectives", optional=True)
+        logger.debug("Objectives: %s", optimiser_objectives_dict)
         return optimiser_objectives_dict
 
-    def read_inverter(self) -> dict:
+    def read_inverter(self) -> Mapping:
         """ Reads the inverters from config file.
 
             Returns:
                 dict with inverter settings
         """
 
-        inverter_dict = dict(self.config.items("Inverter")) \
-            if "Inverters" in self.config else {}
-
-        inverter_dict["charging_power_limit"] = self.config["Inverter"].getfloat("charging_power_limit")
-        inverter_dict["discharging_power_limit"] = self.config["Inverter"].getfloat("discharging_power_limit")
-        inverter_dict["charging_efficiency"] = self.config["Inverter"].getfloat("charging_efficiency")
-        inverter_dict["discharging_efficiency"] = self.config["Inverter"].getfloat("discharging_efficiency")
-        inverter_dict["charging_reactive_power_limit"] = self.config["Inverter"].getfloat("charging_reactive_power_limit")
-        inverter_dict["discharging_reactive_power_limit"] = self.config["Inverter"].getfloat("discharging_reactive_power_limit")
-        inverter_dict["reactive_charging_efficiency"] = self.config["Inverter"].getfloat("reactive_charging_efficiency")
-        inverter_dict["reactive_discharging_efficiency"] = self.config["Inverter"].getfloat("reactive_discharging_efficiency")
-
-        print("Inerter: ", inverter_dict)
+        inverter_dict = self._section("Inverter")
+        logger.debug("Inverter: %s", inverter_dict)
         return inverter_dict
 
-    def read_energy_storage(self) -> dict:
+    def read_energy_storage(self) -> Mapping:
         """ Reads the energy storage from config file.
 
             Returns:
                 dict with energy storage settings
         """
 
-        energy_storage_dict = dict(self.config.items("EnergyStorage")) \
-            if "EnergyStorage" in self.config else {}
-
-        # energy_storage_dict["node_id"] = self.config["EnergyStorage"].getint("node_id")
-        energy_storage_dict["max_capacity"] = self.config["EnergyStorage"].getfloat("max_capacity")
-        energy_storage_dict["depth_of_discharge_limit"] = self.config["EnergyStorage"].getfloat("depth_of_discharge_limit")
-        energy_storage_dict["charging_power_limit"] = self.config["EnergyStorage"].getfloat("charging_power_limit")
-        energy_storage_dict["discharging_power_limit"] = self.config["EnergyStorage"].getfloat("discharging_power_limit")
-        energy_storage_dict["charging_efficiency"] = self.config["EnergyStorage"].getfloat("charging_efficiency")
-        energy_storage_dict["discharging_efficiency"] = self.config["EnergyStorage"].getfloat("discharging_efficiency")
-        energy_storage_dict["throughput_cost"] = self.config["EnergyStorage"].getfloat("throughput_cost")
-        energy_storage_dict["initial_state_of_charge"] = self.config["EnergyStorage"].getfloat("initial_state_of_charge")
-
-        print("energy storage: ", energy_storage_dict)
+        energy_storage_dict = self._section("EnergyStorage")
+        logger.debug("energy storage: %s", energy_storage_dict)
         return energy_storage_dict
 
-    def read_energy_system(self) -> dict:
+    def read_energy_system(self) -> Mapping:
         """ Reads the energy system from config file.
-        
+
             Returns:
                 dict with energy system compoments
         """
 
-        energy_system_dict = dict(self.config.items("EnergySystem")) \
-            if "EnergySystem" in self.config else {}
-
-        energy_system_dict["energy_storage"] = self.config["EnergySystem"].getboolean("energy_storage", fallback=False)
-        energy_system_dict["inverter"] = self.config["EnergySystem"].getboolean("inverter", fallback=False)
-        energy_system_dict["generation"] = self.config["EnergySystem"].getboolean("generation", fallback=False)
-        energy_system_dict["is_hybrid"] = self.config["EnergySystem"].getboolean("is_hybrid", fallback=False)
-
-        print("energy system: ", energy_system_dict)
+        energy_system_dict = self._section("EnergySystem")
+        logger.debug("energy system: %s", energy_system_dict)
         return energy_system_dict
 
-    def read_tariff_factors(self) -> dict:
+    def read_tariff_factors(self) -> Mapping:
         """ Reads the tariff factors from config file.
 
             Returns:
                 dict with tariff factors
         """
 
-        tariff_Factors_dict = dict(self.config.items("TariffFactors")) \
-            if "TariffFactors" in self.config else {}
-
-        tariff_Factors_dict["lt_import_factor"] = self.config["TariffFactors"].getfloat("lt_import_factor")
-        tariff_Factors_dict["lt_export_factor"] = self.config["TariffFactors"].getfloat("lt_export_factor")
-        tariff_Factors_dict["rt_export_factor"] = self.config["TariffFactors"].getfloat("rt_export_factor")
-        tariff_Factors_dict["rt_import_factor"] = self.config["TariffFactors"].getfloat("rt_import_factor")
-        tariff_Factors_dict["subscription_fee"] = self.config["TariffFactors"].getfloat("subscription_fee")
-
-        print("tariff factors: ", tariff_Factors_dict)
+        tariff_Factors_dict = self._section("TariffFactors")
+        logger.debug("tariff factors: %s", tariff_Factors_dict)
         return tariff_Factors_dict
 
-    def read_scenario_info(self) ->dict:
-        scenario_dict = dict(self.config.items("Scenario")) \
-            if "Scenario" in self.config else {}
+    def read_scenario_info(self) -> Mapping:
+        """ Reads the scenario information from config file.
 
-        print("Scenario Information: ", scenario_dict)
+            Returns:
+                dict with scenario information
+        """
+        scenario_dict = self._section("Scenario", optional=True)
+        logger.debug("Scenario Information: %s", scenario_dict)
         return scenario_dict
+
+    def read_all(self) -> Mapping:
+        """Reads all sections of the config file in one go.
+
+        The keys are the names of the read functions without the "read_" prefix, e.g.
+        {"batches": ..., "data_path": ..., ...}. Sections that are required by their read function
+        (e.g. Inverter) and the optimiser objective set are left out if the config file doesn't
+        contain them.
+
+        Returns:
+            config_dict (Mapping): read-only dictionary with the result of each read function
+        """
+        config_dict = {}
+        for name, required_section in _READ_ALL_FUNCTIONS:
+            if required_section is not None and required_section not in self._raw_sections:
+                continue
+            config_dict[name] = getattr(self, "read_" + name)()
+        return types.MappingProxyType(config_dict)
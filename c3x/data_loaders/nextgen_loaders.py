@@ -11,6 +11,29 @@ import pandas
 import numpy
 import pickle
 
+# columns of the NextGen csv files that are used to create the measurement data, all measurements
+# are read as floats so that the type doesn't have to be inferred for each file
+NEXTGEN_COLUMNS = ['major', 'identifier', 'solarPower', 'batteryPower', 'meterPower',
+                   'meterReactivePower', 'batteryReactivePower', 'remainingCharge', 'meterVoltage',
+                   'meterFrequency']
+NEXTGEN_DTYPES = {column: 'float64' for column in NEXTGEN_COLUMNS[2:]}
+
+
+def _read_nextgen_file(path: str) -> dict:
+    """Reads a single NextGen csv file and splits it by node.
+
+    Args:
+        path (str): path to the csv file.
+
+    Returns:
+        node_dfs (dict): dataframes indexed by utc for each node id in the file.
+    """
+    raw_df = pandas.read_csv(path, usecols=NEXTGEN_COLUMNS, dtype=NEXTGEN_DTYPES)
+    raw_df = raw_df.rename(columns={'major': 'utc'})
+    raw_df = raw_df.set_index('utc')
+
+    return dict(list(raw_df.groupby('identifier')))
+
 
 class NextGenData:
     """This classes is responsible for loading and managing next gen data sets provided by Reposit
@@ -90,8 +113,9 @@ class NextGenData:
 
         self.data_name = data_name
 
-        self.data_files = os.listdir(self.data_dir["source"])
-        self.data_files = sorted([f for f in self.data_files if f.endswith('.csv')])
+        with os.scandir(self.data_dir["source"]) as entries:
+            self.data_files = sorted(entry.name for entry in entries
+                                     if entry.name.endswith('.csv') and entry.is_file())
 
         if len(self.data_files) < files_per_batch:
             print("Warning: not enough files for batching, set to appropriate values")
@@ -105,6 +129,7 @@ class NextGenData:
         self.batch_info["files_per_batch"] = files_per_batch
 
         self.node_measurement_dict = {}
+        self.node_info = None
 
         if data_name == 'NextGen':
             batches = numpy.arange(self.batch_info["number_of_batches"])
@@ -132,43 +157,47 @@ class NextGenData:
         batch_end = (batch + 1) * self.batch_info["files_per_batch"]
         data_files = self.data_files[batch_start:batch_end]
 
-        raw_df = pandas.concat([pandas.read_csv(os.path.join(self.data_dir["source"], f))
-                                for f in data_files])
-
-        raw_df = raw_df.rename(columns={'major': 'utc'})
-        raw_df = raw_df.set_index('utc')
+        # each file is parsed and split by node, the parts of each node are kept in file order.
+        # The full batch is never held in a single dataframe.
+        node_parts = {}
+        for data_file in data_files:
+            file_node_dfs = _read_nextgen_file(os.path.join(self.data_dir["source"], data_file))
+            for id_name, node_df in file_node_dfs.items():
+                node_parts.setdefault(id_name, []).append(node_df)
 
         # Note the time intervals of the raw data, even though it's 1.
-        info_df = pandas.read_json(os.path.join(self.data_dir["source"], "deployment_info.json"))
-        info_df = info_df.set_index('id')
-        info_df.to_pickle(self.data_dir["results"] + "/node_info.npy")
+        # The deployment info is the same for all batches, it is read and stored only once.
+        if self.node_info is None:
+            info_df = pandas.read_json(os.path.join(self.data_dir["source"],
+                                                    "deployment_info.json"))
+            self.node_info = info_df.set_index('id')
+            self.node_info.to_pickle(self.data_dir["results"] + "/node_info.npy")
 
-        node_names = sorted(raw_df.identifier.unique())
+        for id_name in sorted(node_parts):
+            node_df = pandas.concat(node_parts.pop(id_name))
 
-        for id_name in node_names:
-            node_df = raw_df.loc[raw_df['identifier'] == id_name]
+            # the derived measurements are calculated on the underlying arrays and wrapped in a
+            # dataframe once, instead of building and concatenating intermediate frames
+            solar_power = node_df['solarPower'].to_numpy()
+            battery_power = node_df['batteryPower'].to_numpy()
+            battery_reactive_power = node_df['batteryReactivePower'].to_numpy()
 
-            # create measurement data for loads
-            power = pandas.DataFrame(-node_df['solarPower']
-                                     - node_df['batteryPower']
-                                     + node_df['meterPower'])
-            reactive_power = pandas.DataFrame(node_df['meterReactivePower']
-                                              - node_df['batteryReactivePower'])
+            # create measurement data for loads (columns are unnamed)
+            power = -solar_power - battery_power + node_df['meterPower'].to_numpy()
+            reactive_power = node_df['meterReactivePower'].to_numpy() - battery_reactive_power
 
-            loads_df = pandas.DataFrame(pandas.concat([power, reactive_power], axis=1))
-            loads_df.set_index(node_df.index)
+            loads_df = pandas.DataFrame(numpy.column_stack((power, reactive_power)),
+                                        index=node_df.index, columns=[0, 0])
 
             # create measurements for solar
-            solar_df = pandas.DataFrame(node_df['solarPower'])
-            solar_df.set_index(node_df.index)
+            solar_df = node_df[['solarPower']]
 
             # create a measurements for battery
-            batt_p_q_c = pandas.concat([node_df['batteryPower'],
-                                        node_df['batteryReactivePower'],
-                                        node_df['remainingCharge'].apply(lambda x: x / 1000)],
-                                       axis=1)
-
-            batt_p_q_c.set_index(node_df.index)
+            remaining_charge = node_df['remainingCharge'].to_numpy() / 1000
+            batt_p_q_c = pandas.DataFrame({'batteryPower': battery_power,
+                                           'batteryReactivePower': battery_reactive_power,
+                                           'remainingCharge': remaining_charge},
+                                          index=node_df.index)
 
             v_f = node_df[['meterVoltage', 'meterFrequency']]
 
@@ -194,17 +223,12 @@ class NextGenData:
 
         """
 
-        nodes = os.listdir(self.data_dir[meas_type])
-        nodes = sorted([f for f in nodes if f.endswith('.npy')])
+        with os.scandir(self.data_dir[meas_type]) as entries:
+            nodes = sorted(entry.name for entry in entries if entry.name.endswith('.npy'))
 
-        node_ids = []
-
-        for node in nodes:
-            parts = node.split('_')
-            if len(parts) > 3:
-                node_id = node.split('_')[2]
-            if node_id not in node_ids:
-                node_ids.append(node_id)
+        # files are named measurement_type_nodeID_batchnumber, ids are kept in order of appearance
+        node_ids = list(dict.fromkeys(node.split('_')[2] for node in nodes
+                                      if node.count('_') >= 3))
 
         return node_ids
 
@@ -225,20 +249,14 @@ class NextGenData:
         """
         batches = numpy.arange(concat_batches_start, concat_batches_end)
 
-        if meas_type == "loads":
-            path = self.data_dir["loads"] + "/measurement_loads_"
-        elif meas_type == "batteries":
-            path = self.data_dir["batteries"] + "/measurement_batteries_"
-        elif meas_type == "solar":
-            path = self.data_dir["solar"] + "/measurement_solar_"
-        elif meas_type == "node":
-            path = self.data_dir["node"] + "/measurement_node_"
+        path = self.data_dir[meas_type] + "/measurement_" + meas_type + "_"
 
         node_ids = self.create_node_list(meas_type)
 
         for node in node_ids:
-            first_run = True
-            measurement_df = pandas.DataFrame()
+            # batches are collected first and concatenated once to avoid copying the data again
+            # for every batch
+            measurement_dfs = []
             for batch in batches:
                 try:
                     print("working on batch: ", batch, "node Id: ",
@@ -249,14 +267,15 @@ class NextGenData:
 
                     os.remove(path + str(node) + '_' + str(batch) + '.npy')
 
-                    if first_run is True:
-                        measurement_df = pandas.DataFrame(measurement_df_tmp)
-                    else:
-                        measurement_df = pandas.concat([measurement_df, measurement_df_tmp], axis=0)
-                    first_run = False
+                    measurement_dfs.append(measurement_df_tmp)
                 except FileNotFoundError:
                     print("FILE NOT FOUND. Data may have been empty. Move on to next file")
 
+            if measurement_dfs:
+                measurement_df = pandas.concat(measurement_dfs, axis=0)
+            else:
+                measurement_df = pandas.DataFrame()
+
             if not measurement_df.empty:
                 measurement_df.to_pickle(path + str(node) + "_node" + '.npy')
             else:
@@ -275,8 +294,8 @@ class NextGenData:
         node_ids_solar = self.create_node_list(meas_type="solar")
         node_ids_loads = self.create_node_list(meas_type="loads")
 
-        node_ids.extend(x for x in node_ids_solar if x not in node_ids)
-        node_ids.extend(x for x in node_ids_loads if x not in node_ids)
+        # union of all node ids, keeping the order in which they are found
+        node_ids = list(dict.fromkeys(node_ids + node_ids_solar + node_ids_loads))
 
         full_dict = {}
 
@@ -9,6 +9,8 @@ measurement data set)
 
 """
 
+import functools
+import os
 import pandas as pd
 import numpy as np
 import json
@@ -18,9 +20,10 @@ from c3x.data_cleaning import unit_conversion
 DAYS_IN_WEEK = 7
 HOURS_IN_DAY = 24
 MONTH_IN_YEAR = 12
-DAYS_OF_WEEK = range(DAYS_IN_WEEK)
-HOURS_OF_DAY = range(HOURS_IN_DAY)
-MONTHS_OF_YEAR = range(MONTH_IN_YEAR)
+
+# price columns that are read from the NEM trading prices ($/MWh)
+NEM_PRICE_COLUMNS = ['RRP', 'RAISE6SECRRP', 'RAISE60SECRRP', 'RAISE5MINRRP', 'LOWER6SECRRP',
+                     'LOWER60SECRRP', 'LOWER5MINRRP']
 
 
 class Rate:
@@ -47,6 +50,28 @@ class Rate:
         self.rate = rate
 
 
+def _resample_five_minutes(trading_price: pd.DataFrame) -> pd.DataFrame:
+    """Forward fills prices to 5 minute intervals.
+
+    NEM prices are usually stored in 5 minute intervals already, in that case the data is returned
+    as it is instead of being resampled.
+
+    Args:
+        trading_price (pd.DataFrame): prices with a datetime index.
+
+    Returns:
+        trading_price (pd.DataFrame): prices in 5 minute intervals.
+    """
+    timestamps = trading_price.index.asi8
+    five_minutes = pd.Timedelta('5min').value
+    already_five_minutes = (len(timestamps) > 0 and timestamps[0] % five_minutes == 0
+                            and (np.diff(timestamps) == five_minutes).all())
+    if already_five_minutes:
+        return trading_price
+
+    return trading_price.resample('5min').ffill()
+
+
 def load_nem_prices_from_DB(table_name, database_name, start_time=None, end_time=None, region="NSW1"):
     """
         loads NEM prices for given interval and region from a database
@@ -64,39 +89,65 @@ def load_nem_prices_from_DB(table_name, database_name, start_time=None, end_time
         """
 
     # query the right amount of data instead of reading the hol think
-    statement = "select * from " + table_name + " where REGIONID == " + "'" + region+"'"
+    statement = sqlalchemy.text("select * from " + table_name + " where REGIONID == :region"
+                                " and time >= :start_time and time <= :end_time")
+    params = {"region": region,
+              "start_time": start_time.timestamp(),
+              "end_time": end_time.timestamp()}
 
     # Open database to read data data in
     database = sqlalchemy.create_engine('sqlite:///' + database_name)
-    conn = database.connect()
-    trading_price = pd.read_sql_query(statement, conn)
+    with database.connect() as conn:
+        trading_price = pd.read_sql_query(statement, conn, params=params)
     trading_price = trading_price.set_index('time')
-    conn.close()
     database.dispose()
 
-    start_timestamp = start_time.timestamp()
-    end_timestamp = end_time.timestamp()
-
-    trading_price = trading_price.truncate(before=start_timestamp, after=end_timestamp)
     trading_price.index = pd.to_datetime(trading_price.index, unit='s')
     trading_price = trading_price.tz_localize('GMT').tz_convert('Australia/Sydney')
 
-    # convert from MWh to kWh
-    trading_price = trading_price[['RRP',
-                                   'RAISE6SECRRP',
-                                   'RAISE60SECRRP',
-                                   'RAISE5MINRRP',
-                                   'LOWER6SECRRP',
-                                   'LOWER60SECRRP',
-                                   'LOWER5MINRRP']] / 1000
-
-    trading_price = trading_price.rename(columns={"RRP": "NEM_RRP"})
+    # convert from MWh to kWh, the selected prices are copied once and divided in place
+    prices = trading_price[NEM_PRICE_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+    prices /= 1000
+    trading_price = pd.DataFrame(prices, index=trading_price.index,
+                                 columns=["NEM_RRP"] + NEM_PRICE_COLUMNS[1:])
     # convert to $/kW/5min
-    trading_price = trading_price.resample('5min').ffill()  # / 12
+    trading_price = _resample_five_minutes(trading_price)  # / 12
 
     return trading_price[:-1]
 
 
+@functools.lru_cache(maxsize=32)
+def _read_month_day_hour_array(tariff_path: str, mtime: int) -> np.ndarray:
+    """creates an array that holds information about a tariff for each hour, day and month of a
+        year from a json tariff definition.
+
+        The array is cached per file and modification time (a changed file is read again), it is
+        shared between callers and therefore read only.
+
+        Args:
+            tariff_path (str): path to the json tariff definition.
+            mtime (int): modification time of the file in ns.
+
+        Returns:
+            month_day_hour_array (np.ndarray): read only array of rates (month x weekday x hour).
+    """
+    # creates an array to hold tariff information for each hour, day and moth of a year
+    month_day_hour_array = np.zeros([MONTH_IN_YEAR, DAYS_IN_WEEK, HOURS_IN_DAY])
+
+    with open(tariff_path, 'r') as jf:
+        raw_rates = json.load(jf)
+
+        # a tariff is build for a full year, if no rate can be applied for a specific time
+        # the tariff is 0. A rate is valid in every month, from_weekday to to_weekday and from_hour
+        # to to_hour (both inclusive)
+        for r in raw_rates["rates"]:
+            month_day_hour_array[:, r["from_weekday"]:r["to_weekday"] + 1,
+                                 r["from_hour"]:r["to_hour"] + 1] += r["rate"]
+
+    month_day_hour_array.setflags(write=False)
+    return month_day_hour_array
+
+
 def datetime_tariff_map(datetime: pd.DatetimeIndex, month_day_hour_array):
     """
     A tariff is valid during a certain time range. The data to determine validity may be stored as
@@ -111,7 +162,13 @@ def datetime_tariff_map(datetime: pd.DatetimeIndex, month_day_hour_array):
         tariff: Mapped tariff information to specific timeframe
 
     """
-    tariff_array = month_day_hour_array[datetime.month - 1, datetime.weekday, datetime.hour]
+    # a single gather on the flattened array instead of indexing three axes. The array has 2016
+    # entries, positions are stored as int16 to keep the index compact
+    month = datetime.month.to_numpy().astype(np.int16)
+    weekday = datetime.weekday.to_numpy().astype(np.int16)
+    hour = datetime.hour.to_numpy().astype(np.int16)
+    flat_index = ((month - 1) * DAYS_IN_WEEK + weekday) * HOURS_IN_DAY + hour
+    tariff_array = month_day_hour_array.reshape(-1)[flat_index]
     return tariff_array
 
 
@@ -131,27 +188,9 @@ def load_tariff(data_location: str, filename: str, timestamp_index,
             tariff_series (pd.Series): of tariff values
     """
 
-    # creates an array to hold tariff information for each hour, day and moth of a year
-    month_day_hour_array = np.zeros([MONTH_IN_YEAR, DAYS_IN_WEEK, HOURS_IN_DAY])
-
-    with open(data_location + filename, 'r') as jf:
-        raw_rates = json.load(jf)
-
-        for r in raw_rates["rates"]:
-            # create list to find in which time range the tariff is valid
-            month_valid = MONTHS_OF_YEAR
-            days_valid = range(r["from_weekday"], r["to_weekday"] + 1)
-            hours_valid = range(r["from_hour"], r["to_hour"] + 1)
-
-            # a tariff is build for a full year, if no rate can be applied for a specific time
-            # the tariff is 0
-            for month in MONTHS_OF_YEAR:
-                if month in month_valid:
-                    for day in DAYS_OF_WEEK:
-                        if day in days_valid:
-                            for hour in HOURS_OF_DAY:
-                                if hour in hours_valid:
-                                    month_day_hour_array[month, day, hour] += r["rate"]
+    tariff_path = data_location + filename
+    month_day_hour_array = _read_month_day_hour_array(tariff_path,
+                                                      os.stat(tariff_path).st_mtime_ns)
 
     # maps a tariff (which is bound to a timezone) to a measurement index
     tariff_series = pd.Series(name='rate', index=timestamp_index,
@@ -198,34 +237,29 @@ def load_nem_prices(table_name, database_name, start_time=None, end_time=None, r
         """
 
     # query the right amount of data instead of reading the hol think
-    statement = "select * from " + table_name + " where REGIONID == '" + region +"'"
+    statement = sqlalchemy.text("select * from " + table_name + " where REGIONID == :region"
+                                " and time >= :start_time and time <= :end_time")
+    params = {"region": region,
+              "start_time": start_time.timestamp(),
+              "end_time": end_time.timestamp()}
 
     # Open database to read data data in
     database = sqlalchemy.create_engine('sqlite:///' + database_name)
-    conn = database.connect()
-    trading_price = pd.read_sql_query(statement, conn)
+    with database.connect() as conn:
+        trading_price = pd.read_sql_query(statement, conn, params=params)
     trading_price = trading_price.set_index('time')
-    conn.close()
     database.dispose()
 
-    start_timestamp = start_time.timestamp()
-    end_timestamp = end_time.timestamp()
-
-    trading_price = trading_price.truncate(before=start_timestamp, after=end_timestamp)
     trading_price.index = pd.to_datetime(trading_price.index, unit='s')
     trading_price = trading_price.tz_localize('GMT').tz_convert('Australia/Sydney')
 
-    # convert from MWh to kWh
-    trading_price = trading_price[['RRP',
-                                   'RAISE6SECRRP',
-                                   'RAISE60SECRRP',
-                                   'RAISE5MINRRP',
-                                   'LOWER6SECRRP',
-                                   'LOWER60SECRRP',
-                                   'LOWER5MINRRP']] / 1000
-    trading_price = trading_price.rename(columns={"RRP": "NEM_RRP"})
+    # convert from MWh to kWh, the selected prices are copied once and divided in place
+    prices = trading_price[NEM_PRICE_COLUMNS].to_numpy(dtype=np.float64, copy=True)
+    prices /= 1000
+    trading_price = pd.DataFrame(prices, index=trading_price.index,
+                                 columns=["NEM_RRP"] + NEM_PRICE_COLUMNS[1:])
 
     # convert to $/kW/5min
-    trading_price = trading_price.resample('5min').ffill()  # / 12
+    trading_price = _resample_five_minutes(trading_price)  # / 12
 
     return trading_price[:-1]
\ No newline at end of file
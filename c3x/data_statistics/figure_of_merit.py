@@ -15,6 +15,37 @@ from c3x.data_cleaning import unit_conversion
 #Add inverters: Inverters are not considered at the moment
 #Improve Nan Handeling
 
+def _row_sums(data_df: pd.DataFrame) -> pd.Series:
+    """
+    sums all columns of a data frame per row on the underlying array.
+    Missing values are skipped (count as zero), the same as DataFrame.sum(axis=1)
+
+    Args:
+        data_df (pd.DataFrame): measurements with one column per measurement point
+
+    return:
+        row_sums (pd.Series): sum per row, with the index of data_df
+    """
+    row_sums = numpy.nansum(data_df.to_numpy(dtype=numpy.float64), axis=1)
+    return pd.Series(row_sums, index=data_df.index)
+
+
+def _concat_frame(data_parts: list, axis: int = 0) -> pd.DataFrame:
+    """
+    concatenates measurements collected in a list with a single pd.concat
+
+    Args:
+        data_parts (list): series or data frames to be concatenated
+        axis (int): how data is concatenated
+
+    return:
+        data_df (pd.DataFrame): concatenated data, an empty data frame if data_parts is empty
+    """
+    if not data_parts:
+        return pd.DataFrame()
+    return pd.DataFrame(pd.concat(data_parts, axis=axis))
+
+
 def meter_power(meas_dict: dict, meter: int, axis: int = 0, column: int = 0) -> pd.Series:
     """
     calculates the power for a meter of individual measurement points
@@ -29,22 +60,38 @@ def meter_power(meas_dict: dict, meter: int, axis: int = 0, column: int = 0) ->
     return:
         meter_p (pd.Series): combined power (solar, battery, load)
     """
-    meter_p = pd.DataFrame()
+    # the measurements are collected first and concatenated once
+    meter_ps = []
 
     if meas_dict[meter]:
-        meter_p = pd.DataFrame()
         for meas in meas_dict[meter]:
-            if 'load' in meas:
-                meter_p = pd.concat([meter_p, meas_dict[meter][meas].iloc[:,column]], axis=axis)
-            elif 'solar' in meas:
-                meter_p = pd.concat([meter_p, meas_dict[meter][meas].iloc[:,column]], axis=axis)
-            elif 'batteries' in meas:
-                meter_p = pd.concat([meter_p, meas_dict[meter][meas].iloc[:,column]], axis=axis)
-
-    meter_p = meter_p.sum(axis=1)
+            if 'load' in meas or 'solar' in meas or 'batteries' in meas:
+                meter_ps.append(meas_dict[meter][meas].iloc[:, column])
+
+    meter_p = _row_sums(_concat_frame(meter_ps, axis=axis))
     return meter_p
 
 
+def _aligned_tariff_values(tariff, index: pd.Index):
+    """
+        Returns the tariff as a scalar or an array matching index, None if it needs alignment.
+
+        Args:
+            tariff (pd.Series or float): tariff in $/kWh.
+            index (pd.Index): index of the metered energy.
+
+        Returns:
+            values (numpy.ndarray, float or None): tariff values in index order
+    """
+    if isinstance(tariff, pd.Series):
+        if tariff.index is index or tariff.index.equals(index):
+            return tariff.to_numpy(dtype=numpy.float64)
+        return None
+    if numpy.ndim(tariff) == 0:
+        return tariff
+    return None
+
+
 def financial(meter_p: pd.Series, import_tariff: pd.Series, export_tariff: pd.Series) -> pd.Series:
     """
         Evaluate the financial outcome for a customer.
@@ -61,11 +108,52 @@ def financial(meter_p: pd.Series, import_tariff: pd.Series, export_tariff: pd.Se
     """
 
     # Note: need to ensure meter data is converted to kWh
+    return _financial_kwh(_meter_energy(meter_p), import_tariff, export_tariff)
+
+
+def _meter_energy(meter_p: pd.Series) -> pd.Series:
+    """
+        Converts the power of a node to energy per measurement point.
+
+        Args:
+            meter_p (pd.Series): Power of a node, with a constant step size in timestamps.
+
+        Returns:
+            meter (pd.Series): energy per measurement point
+    """
     timestep = numpy.timedelta64(meter_p.index[1] - meter_p.index[0])
-    meter = unit_conversion.convert_watt_to_watt_hour(meter_p, timedelta=timestep)
+    return unit_conversion.convert_watt_to_watt_hour(meter_p, timedelta=timestep)
 
-    import_power_cost = meter.where(meter >= 0).fillna(value=0.0)
-    export_power_revenue = meter.where(meter < 0).fillna(value=0.0)
+
+def _financial_kwh(meter: pd.Series, import_tariff: pd.Series,
+                   export_tariff: pd.Series) -> pd.Series:
+    """
+        Evaluate the financial outcome for energy that was already converted to kWh.
+
+        Args:
+            meter (pd.Series): Energy of a node in kWh.
+            import_tariff (pd.Series): Expects this to be in $/kWh.
+            export_tariff (pd.Series): Expects this to be in $/kWh.
+
+        Returns:
+            cost (pd.Series): cost per measurement point, using import and export tariffs
+    """
+    # split imports and exports in one pass over the values, missing data counts as zero
+    meter_values = meter.to_numpy(dtype=numpy.float64)
+    import_energy = numpy.where(meter_values >= 0, meter_values, 0.0)
+    export_energy = numpy.where(meter_values < 0, meter_values, 0.0)
+
+    import_values = _aligned_tariff_values(import_tariff, meter.index)
+    export_values = _aligned_tariff_values(export_tariff, meter.index)
+    if import_values is not None and export_values is not None:
+        # tariffs share the meter index, so no alignment is needed
+        same_name = all(getattr(tariff, 'name', meter.name) == meter.name
+                        for tariff in (import_tariff, export_tariff))
+        return pd.Series(import_energy * import_values + export_energy * export_values,
+                         index=meter.index, name=meter.name if same_name else None)
+
+    import_power_cost = pd.Series(import_energy, index=meter.index, name=meter.name)
+    export_power_revenue = pd.Series(export_energy, index=meter.index, name=meter.name)
 
     cost = import_power_cost * import_tariff + export_power_revenue*export_tariff
 
@@ -104,19 +192,75 @@ def customer_financial(meas_dict: dict, node_keys: list = None, tariff: dict = N
                                          tariff[key]['import_tariff'],
                                          tariff[key]['export_tariff'])
                 results_dict[key] = meter_p_cost
+                average.append(meter_p_cost)
 
-    initiate = 0
-    for node in results_dict.values():
-        average = node if initiate == 0 else average.append(node)
-        initiate = 1
-
-
-    average = numpy.nanmean(average)
+    average = pd.concat(average) if average else pd.Series(dtype=float)
+    average = numpy.nanmean(average.values)
 
     results_dict["average"] = average
     return results_dict
 
 
+def _tariff_cost(energy: pd.Series, tariff: pd.Series) -> pd.Series:
+    """
+        Evaluates the cost of an energy flow that is priced with a single tariff.
+
+        Args:
+            energy (pd.Series): energy flow to be priced.
+            tariff (pd.Series): tariff applied to the energy flow.
+
+        Returns:
+            cost (pd.Series): cost per measurement point
+    """
+    return financial(energy, tariff, 0)
+
+
+def _cached_tariff_cost():
+    """
+        Creates a cost function like _tariff_cost that evaluates each pair of energy flow and
+        tariff once, and converts each energy flow to kWh once.
+
+        The flows and tariffs are referenced by the cache, so their ids stay unique while it
+        exists. The cache lives as long as the returned function (one lem_financial call).
+
+        Returns:
+            cost (function): cost(energy, tariff), results are shared (do not modify)
+    """
+    energies = {}
+    costs = {}
+
+    def cost(energy: pd.Series, tariff: pd.Series) -> pd.Series:
+        if id(energy) not in energies:
+            energies[id(energy)] = (energy, _meter_energy(energy))
+        key = (id(energy), id(tariff))
+        if key not in costs:
+            costs[key] = (tariff, _financial_kwh(energies[id(energy)][1], tariff, 0))
+        return costs[key][1]
+
+    return cost
+
+
+def _customer_cost(cost, tariff: dict, energy_grid_load: pd.Series,
+                   energy_solar_grid: pd.Series, energy_battery_load: pd.Series,
+                   energy_solar_battery: pd.Series, energy_solar_load: pd.Series) -> pd.Series:
+    """
+        evaluates the customers cost with the given cost function, see customer_cost_financial
+    """
+    customer_cost = cost(energy_grid_load, tariff['re_import_tariff']).copy()
+    customer_cost += cost(energy_grid_load, tariff['rt_import_tariff'])
+    customer_cost += cost(energy_battery_load, tariff['le_import_tariff'])
+    customer_cost += cost(energy_battery_load, tariff['lt_import_tariff'])
+    customer_cost -= cost(energy_solar_grid, tariff['re_export_tariff'])
+    customer_cost += cost(energy_solar_grid, tariff['rt_export_tariff'])
+    customer_cost -= cost(energy_solar_battery, tariff['le_export_tariff'])
+    customer_cost += cost(energy_solar_battery, tariff['lt_export_tariff'])
+    customer_cost -= cost(energy_solar_battery, tariff['le_export_tariff'])
+    customer_cost += cost(energy_solar_load, tariff['lt_import_tariff'])
+    customer_cost += cost(energy_solar_load, tariff['lt_export_tariff'])
+
+    return customer_cost
+
+
 def customer_cost_financial(tariff: dict, energy_grid_load: pd.Series, energy_solar_grid: pd.Series,
                             energy_battery_load: pd.Series, energy_solar_battery: pd.Series,
                             energy_solar_load: pd.Series) -> pd.Series:
@@ -134,19 +278,26 @@ def customer_cost_financial(tariff: dict, energy_grid_load: pd.Series, energy_so
         Returns:
             customer_cost (pd.Series):
     """
-    customer_cost = financial(energy_grid_load, tariff['re_import_tariff'], 0)
-    customer_cost += financial(energy_grid_load, tariff['rt_import_tariff'], 0)
-    customer_cost += financial(energy_battery_load, tariff['le_import_tariff'], 0)
-    customer_cost += financial(energy_battery_load, tariff['lt_import_tariff'], 0)
-    customer_cost -= financial(energy_solar_grid, tariff['re_export_tariff'], 0)
-    customer_cost += financial(energy_solar_grid, tariff['rt_export_tariff'], 0)
-    customer_cost -= financial(energy_solar_battery, tariff['le_export_tariff'], 0)
-    customer_cost += financial(energy_solar_battery, tariff['lt_export_tariff'], 0)
-    customer_cost -= financial(energy_solar_battery, tariff['le_export_tariff'], 0)
-    customer_cost += financial(energy_solar_load, tariff['lt_import_tariff'], 0)
-    customer_cost += financial(energy_solar_load, tariff['lt_export_tariff'], 0)
+    return _customer_cost(_tariff_cost, tariff, energy_grid_load, energy_solar_grid,
+                          energy_battery_load, energy_solar_battery, energy_solar_load)
 
-    return customer_cost
+
+def _battery_cost(cost, tariff: dict, energy_grid_battery: pd.Series,
+                  energy_battery_grid: pd.Series, energy_battery_load: pd.Series,
+                  energy_solar_battery: pd.Series) -> pd.Series:
+    """
+        evaluates the battery cost with the given cost function, see battery_cost_financial
+    """
+    battery_cost = cost(energy_solar_battery, tariff['le_import_tariff']).copy()
+    battery_cost += cost(energy_solar_battery, tariff['lt_import_tariff'])
+    battery_cost -= cost(energy_battery_load, tariff['le_export_tariff'])
+    battery_cost += cost(energy_battery_load, tariff['lt_export_tariff'])
+    battery_cost += cost(energy_grid_battery, tariff['re_import_tariff'])
+    battery_cost += cost(energy_grid_battery, tariff['rt_import_tariff'])
+    battery_cost -= cost(energy_battery_grid, tariff['re_export_tariff'])
+    battery_cost += cost(energy_battery_grid, tariff['rt_export_tariff'])
+
+    return battery_cost
 
 
 def battery_cost_financial(tariff: dict, energy_grid_battery: pd.Series,
@@ -165,16 +316,28 @@ def battery_cost_financial(tariff: dict, energy_grid_battery: pd.Series,
         Returns:
             battery_cost (pd.Series):
     """
-    battery_cost = financial(energy_solar_battery, tariff['le_import_tariff'], 0)
-    battery_cost += financial(energy_solar_battery, tariff['lt_import_tariff'], 0)
-    battery_cost -= financial(energy_battery_load, tariff['le_export_tariff'], 0)
-    battery_cost += financial(energy_battery_load, tariff['lt_export_tariff'], 0)
-    battery_cost += financial(energy_grid_battery, tariff['re_import_tariff'], 0)
-    battery_cost += financial(energy_grid_battery, tariff['rt_import_tariff'], 0)
-    battery_cost -= financial(energy_battery_grid, tariff['re_export_tariff'], 0)
-    battery_cost += financial(energy_battery_grid, tariff['rt_export_tariff'], 0)
+    return _battery_cost(_tariff_cost, tariff, energy_grid_battery, energy_battery_grid,
+                         energy_battery_load, energy_solar_battery)
 
-    return battery_cost
+
+def _network_cost(cost, tariff: dict, energy_grid_load: pd.Series,
+                  energy_grid_battery: pd.Series, energy_battery_grid: pd.Series,
+                  energy_battery_load: pd.Series, energy_solar_battery: pd.Series,
+                  energy_solar_load: pd.Series) -> pd.Series:
+    """
+        evaluates the network cost with the given cost function, see network_cost_financial
+    """
+    network_cost = -cost(energy_grid_load, tariff['rt_import_tariff'])
+    network_cost -= cost(energy_battery_load, tariff['lt_import_tariff'])
+    network_cost -= cost(energy_battery_load, tariff['lt_export_tariff'])
+    network_cost -= cost(energy_solar_battery, tariff['lt_import_tariff'])
+    network_cost -= cost(energy_solar_battery, tariff['lt_export_tariff'])
+    network_cost -= cost(energy_grid_battery, tariff['rt_import_tariff'])
+    network_cost -= cost(energy_battery_grid, tariff['rt_export_tariff'])
+    network_cost -= cost(energy_solar_load, tariff['lt_import_tariff'])
+    network_cost -= cost(energy_solar_load, tariff['lt_export_tariff'])
+
+    return network_cost
 
 
 def network_cost_financial(tariff: dict, energy_grid_load: pd.Series,
@@ -197,17 +360,9 @@ def network_cost_financial(tariff: dict, energy_grid_load: pd.Series,
             network_cost(pd.Series)
     """
 
-    network_cost = -financial(energy_grid_load, tariff['rt_import_tariff'], 0)
-    network_cost -= financial(energy_battery_load, tariff['lt_import_tariff'], 0)
-    network_cost -= financial(energy_battery_load, tariff['lt_export_tariff'], 0)
-    network_cost -= financial(energy_solar_battery, tariff['lt_import_tariff'], 0)
-    network_cost -= financial(energy_solar_battery, tariff['lt_export_tariff'], 0)
-    network_cost -= financial(energy_grid_battery, tariff['rt_import_tariff'], 0)
-    network_cost -= financial(energy_battery_grid, tariff['rt_export_tariff'], 0)
-    network_cost -= financial(energy_solar_load, tariff['lt_import_tariff'], 0)
-    network_cost -= financial(energy_solar_load, tariff['lt_export_tariff'], 0)
-
-    return network_cost
+    return _network_cost(_tariff_cost, tariff, energy_grid_load, energy_grid_battery,
+                         energy_battery_grid, energy_battery_load, energy_solar_battery,
+                         energy_solar_load)
 
 
 def lem_financial(customer_tariffs, energy_grid_load, energy_grid_battery, energy_solar_grid,
@@ -232,18 +387,20 @@ def lem_financial(customer_tariffs, energy_grid_load, energy_grid_battery, energ
             customer_cost, battery_cost, network_cost
     """
 
-    customer_cost = customer_cost_financial(customer_tariffs, energy_grid_load, energy_solar_grid,
-                                            energy_battery_load, energy_solar_battery,
-                                            energy_solar_load)
+    # flows priced with the same tariff in several cost functions are evaluated once
+    cost = _cached_tariff_cost()
+
+    customer_cost = _customer_cost(cost, customer_tariffs, energy_grid_load, energy_solar_grid,
+                                   energy_battery_load, energy_solar_battery, energy_solar_load)
 
     bt_choice = battery_tariffs if battery_tariffs else customer_tariffs
 
-    battery_cost = battery_cost_financial(bt_choice, energy_grid_battery, energy_battery_grid,
-                                          energy_battery_load, energy_solar_battery)
+    battery_cost = _battery_cost(cost, bt_choice, energy_grid_battery, energy_battery_grid,
+                                 energy_battery_load, energy_solar_battery)
 
-    network_cost = network_cost_financial(customer_tariffs, energy_grid_load, energy_grid_battery,
-                                          energy_battery_grid, energy_battery_load,
-                                          energy_solar_battery, energy_solar_load)
+    network_cost = _network_cost(cost, customer_tariffs, energy_grid_load, energy_grid_battery,
+                                 energy_battery_grid, energy_battery_load, energy_solar_battery,
+                                 energy_solar_load)
 
     return customer_cost, battery_cost, network_cost
 
@@ -264,29 +421,48 @@ def peak_powers(meas_dict: dict, node_keys: list = None) -> dict:
     """
 
     nodes = node_keys if node_keys else meas_dict.keys()
-    sum_meter_power = pd.DataFrame([])
+    meter_ps = []
 
     for key in nodes:
         if type(key) == int:
             key = str(key)
         if meas_dict[key]:
-            meter_p = meter_power(meas_dict, key, axis=1)
-            if sum_meter_power.empty:
-                sum_meter_power = meter_p.copy()
-            else:
-                sum_meter_power = pd.concat([sum_meter_power, meter_p], axis=1, sort=True)
-    sum_power = sum_meter_power.sum(axis=1)
-    aver_power = numpy.nanmean(sum_meter_power, axis=1)
+            meter_ps.append(meter_power(meas_dict, key, axis=1))
+
+    sum_meter_power = pd.concat(meter_ps, axis=1, sort=True)
+    meter_values = sum_meter_power.to_numpy(dtype=numpy.float64)
+    sum_power = numpy.nansum(meter_values, axis=1)
+    aver_power = numpy.nanmean(meter_values, axis=1)
 
     return {"peak_power_import": numpy.max(sum_power),
             "peak_power_export": numpy.min(sum_power),
             "peak_power_import_av": numpy.max(aver_power),
             "peak_power_export_av": numpy.min(aver_power),
-            "peak_power_import_index": sum_power.idxmax(),
-            "peak_power_export_index": sum_power.idxmax()}
+            "peak_power_import_index": sum_meter_power.index[numpy.argmax(sum_power)],
+            "peak_power_export_index": sum_meter_power.index[numpy.argmin(sum_power)]}
 
 
-def self_sufficiency(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.DataFrame):
+def _net_loads(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.DataFrame) -> tuple:
+    """
+        Sums the net load of a single node without and with its batteries.
+
+        Args:
+            load_p (pd.dataframe): measurement data for load of a s single node.
+            solar_p (pd.dataframe): measurement data for solar of a s single node.
+            battery_p(pd.dataframe): measurement data for battery of a s single node.
+
+        Returns:
+            tuple (numpy.ndarray, numpy.ndarray): net load of load and solar, net load of load,
+                                                  solar and batteries
+    """
+    net_load_solar = _row_sums(pd.concat((load_p, solar_p), axis=1))
+    net_load_solar_battery = _row_sums(pd.concat((load_p, solar_p, battery_p), axis=1))
+
+    return net_load_solar.to_numpy(), net_load_solar_battery.to_numpy()
+
+
+def self_sufficiency(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.DataFrame,
+                     net_loads: tuple = None):
     """
         Self-sufficiency = 1 - imports / consumption
 
@@ -298,6 +474,7 @@ def self_sufficiency(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.
             load_p (pd.dataframe): measurement data for load of a s single node.
             solar_p (pd.dataframe): measurement data for solar of a s single node.
             battery_p(pd.dataframe): measurement data for battery of a s single node.
+            net_loads (tuple): net loads as returned by _net_loads, calculated if not given.
 
         Returns:
             results_dict: self_consumption_solar, self_consumption_batteries
@@ -306,15 +483,14 @@ def self_sufficiency(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.
     self_sufficiency_battery = numpy.nan
 
     if not load_p.empty:
-        net_load_solar = pd.concat((load_p, solar_p), axis=1).sum(axis=1)
-        net_load_solar_battery = pd.concat((load_p, solar_p, battery_p), axis=1).sum(axis=1)
-
-        #create an array that contains which entries are import and which are export
-        mask_import_solar = (net_load_solar >= 0)
-        mask_import_solar_battery = (net_load_solar_battery >= 0)
+        if net_loads is None:
+            net_loads = _net_loads(load_p, solar_p, battery_p)
+        net_load_solar, net_load_solar_battery = net_loads
 
-        net_import_solar = net_load_solar * mask_import_solar
-        net_import_solar_battery = net_load_solar_battery * mask_import_solar_battery
+        # only the imports are summed, exports count as zero
+        net_import_solar = numpy.where(net_load_solar >= 0, net_load_solar, 0.0)
+        net_import_solar_battery = numpy.where(net_load_solar_battery >= 0,
+                                               net_load_solar_battery, 0.0)
 
         sum_load = numpy.nansum(load_p)
         sum_solar = numpy.nansum(solar_p)
@@ -330,7 +506,8 @@ def self_sufficiency(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.
             "self_sufficiency_batteries": self_sufficiency_battery}
 
 
-def self_consumption(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.DataFrame) -> dict:
+def self_consumption(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.DataFrame,
+                     net_loads: tuple = None) -> dict:
     """
         Self-consumption = 1 - exports / generation
 
@@ -342,20 +519,19 @@ def self_consumption(load_p: pd.DataFrame, solar_p: pd.DataFrame, battery_p: pd.
             load_p (pd.dataframe): measurement data for load of a s single node.
             solar_p (pd.dataframe): measurement data for solar of a s single node.
             battery_p(pd.dataframe): measurement data for battery of a s single node.
+            net_loads (tuple): net loads as returned by _net_loads, calculated if not given.
 
         Retruns:
             results_dict: self_consumption_solar, self_consumption_batteries
     """
 
-    net_load_solar = pd.concat((load_p, solar_p), axis=1).sum(axis=1)
-    net_load_solar_battery = pd.concat((load_p, solar_p, battery_p), axis=1).sum(axis=1)
-
-    # create an array that contains which entries are import and which are export
-    mask_export_solar = (net_load_solar < 0)
-    mask_export_solar_battery = (net_load_solar_battery < 0)
+    if net_loads is None:
+        net_loads = _net_loads(load_p, solar_p, battery_p)
+    net_load_solar, net_load_solar_battery = net_loads
 
-    net_export_solar = net_load_solar * mask_export_solar
-    net_import_solar_battery = net_load_solar_battery * mask_export_solar_battery
+    # only the exports are summed, imports count as zero
+    net_export_solar = numpy.where(net_load_solar < 0, net_load_solar, 0.0)
+    net_import_solar_battery = numpy.where(net_load_solar_battery < 0, net_load_solar_battery, 0.0)
 
     sum_solar = numpy.nansum(solar_p)
 
@@ -432,21 +608,27 @@ def self_sufficiency_self_consumption(meas_dict: dict, node_keys: list = None, c
         if type(key) == int:
             key = str(key)
         if meas_dict[key]:
-            load_p = pd.DataFrame()
-            solar_p = pd.DataFrame()
-            battery_p = pd.DataFrame()
+            load_ps = []
+            solar_ps = []
+            battery_ps = []
             for meas in meas_dict[key]:
                 data_df = meas_dict[key][meas]
                 if not data_df.empty:
                     if 'loads' in meas:
-                        load_p = pd.concat([load_p, meas_dict[key][meas].iloc[:,column]])
+                        load_ps.append(data_df.iloc[:, column])
                     elif 'solar' in meas:
-                        solar_p = pd.concat([solar_p, meas_dict[key][meas].iloc[:,column]])
+                        solar_ps.append(data_df.iloc[:, column])
                     elif 'batteries' in meas:
-                        battery_p = pd.concat([battery_p, meas_dict[key][meas].iloc[:,column]])
+                        battery_ps.append(data_df.iloc[:, column])
 
-            self_sufficiency_dict = self_sufficiency(load_p, solar_p, battery_p)
-            self_consumption_dict = self_consumption(load_p, solar_p, battery_p)
+            load_p = _concat_frame(load_ps)
+            solar_p = _concat_frame(solar_ps)
+            battery_p = _concat_frame(battery_ps)
+
+            # both figures are based on the same net loads
+            net_loads = _net_loads(load_p, solar_p, battery_p)
+            self_sufficiency_dict = self_sufficiency(load_p, solar_p, battery_p, net_loads)
+            self_consumption_dict = self_consumption(load_p, solar_p, battery_p, net_loads)
 
             results_dict[key] = self_sufficiency_dict.copy()
             results_dict[key].update(self_consumption_dict)
@@ -479,9 +661,9 @@ def network_net_power(meas_dict: dict, node_keys: list = None, column: int = 0)
     """
 
     nodes = node_keys if node_keys else meas_dict.keys()
-    load_p = pd.DataFrame()
-    solar_p = pd.DataFrame()
-    battery_p = pd.DataFrame()
+    load_ps = []
+    solar_ps = []
+    battery_ps = []
 
     for key in nodes:
         if type(key) == int:
@@ -489,21 +671,19 @@ def network_net_power(meas_dict: dict, node_keys: list = None, column: int = 0)
         if meas_dict[key]:
             for meas in meas_dict[key]:
                 if 'load' in meas:
-                    load_p = pd.concat([load_p, meas_dict[key][meas].iloc[:,column]], axis=1)
+                    load_ps.append(meas_dict[key][meas].iloc[:, column])
                 elif 'solar' in meas:
-                    solar_p = pd.concat([solar_p, meas_dict[key][meas].iloc[:,column]], axis=1)
+                    solar_ps.append(meas_dict[key][meas].iloc[:, column])
                 elif 'batteries' in meas:
-                    battery_p = pd.concat([battery_p, meas_dict[key][meas].iloc[:,column]],axis=1)
-
-    net_load = pd.DataFrame()
-    net_load = pd.concat([net_load, load_p, solar_p, battery_p], axis=1).sum(axis=1)
+                    battery_ps.append(meas_dict[key][meas].iloc[:, column])
 
-    # create an array that contains which entries are import and which are export
-    net_import = numpy.copy(net_load)
-    net_export = numpy.copy(net_load)
+    # all columns side by side (loads, solar, batteries) in a single concat
+    net_load = _row_sums(_concat_frame(load_ps + solar_ps + battery_ps, axis=1))
 
-    net_import[net_import < 0] = 0
-    net_export[net_export > 0] = 0
+    # imports and exports are the net load clipped at zero, each in a single pass
+    net_load_values = net_load.to_numpy()
+    net_import = numpy.maximum(net_load_values, 0.0)
+    net_export = numpy.minimum(net_load_values, 0.0)
 
     return {'net_load': net_load, 'net_import': net_import, 'net_export': net_export}
 
@@ -524,36 +704,39 @@ def solar_kwh_per_kw(meas_dict: dict, node_info: pd.DataFrame, node_keys: list =
     """
     results_dict = {}
     hours_in_day = 24
-    initiate = 0
+    mega_df = []
     nu_nonzero_properties = 0
 
+    # rated solar power per node id, looked up once per solar measurement
+    system_max_p = {int(node_id): max_p for node_id, max_p in node_info["system_max_p"].items()}
+
     nodes = node_keys if node_keys else meas_dict.keys()
 
     for key in nodes:
         if type(key) == int:
             key = str(key)
         if meas_dict[key]:
-            solar_power = pd.DataFrame([])
+            solar_ps = []
             solar_capacity = 0
+            node_id = int(key)
 
             for meas in meas_dict[key]:
                 if 'solar' in meas:
-                    solar_power = pd.concat([solar_power, meas_dict[key][meas].iloc[:,column]])
+                    solar_ps.append(meas_dict[key][meas].iloc[:, column])
 
                     #calculates the overall solar power capacity
-                    node_data = node_info[node_info.index == int(key)]
-                    solar_capacity += node_data["system_max_p"].get(int(key))
+                    solar_capacity += system_max_p.get(node_id, 0)
 
             # summing up all the individual solar powers
-            sum_power = solar_power.sum(axis=1)
+            sum_power = _row_sums(_concat_frame(solar_ps))
 
             if solar_capacity != 0:
                 sum_power /= solar_capacity
-                mega_df = sum_power if initiate == 0 else mega_df.append(sum_power)
-                initiate = 1
+                mega_df.append(sum_power)
                 results_dict[key] = -numpy.nanmean(sum_power)*hours_in_day
                 nu_nonzero_properties += 1
 
-    kwh_per_kw_true_average = numpy.nanmean(mega_df)*hours_in_day
+    mega_df = pd.concat(mega_df) if mega_df else pd.Series(dtype=float)
+    kwh_per_kw_true_average = numpy.nanmean(mega_df.values)*hours_in_day
     results_dict["average"] = -kwh_per_kw_true_average
     return results_dict
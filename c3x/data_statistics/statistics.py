@@ -25,19 +25,17 @@ def nodes_per_batch(data_dir, batch_number, measurement_types):
         Returns:
             node_list(list): contains node_ids found in a batch
     """
-    node_list = []
+    # dict keys keep the order in which the nodes are found without a linear search
+    node_ids = {}
 
     for measurement_type in measurement_types:
         data_files = os.listdir(data_dir[measurement_type])
         data_files = sorted([f for f in data_files if f.endswith('_' + str(batch_number) + '.npy')])
 
-        for file in data_files:
-            if "node" not in file:
-                node_id = file.split('_')
-                node_id = node_id[2]
-                node_list.append(node_id) if node_id not in node_list else node_list
+        node_ids.update(dict.fromkeys(file.split('_')[2] for file in data_files
+                                      if "node" not in file))
 
-    return node_list
+    return list(node_ids)
 
 
 def batch_with_highest_node_count(data_dir, batch_info, measurement_types):
@@ -57,15 +55,18 @@ def batch_with_highest_node_count(data_dir, batch_info, measurement_types):
     result_batches = []
 
     batches = numpy.arange(batch_info["number_of_batches"])
+
+    # each folder is scanned once, collecting the node ids per batch file ending
+    batch_nodes = {str(batch) + '.npy': set() for batch in batches}
+    for measurement_type in measurement_types:
+        with os.scandir(data_dir[measurement_type]) as entries:
+            for entry in entries:
+                file_ending = entry.name.rsplit('_', 1)[-1]
+                if file_ending in batch_nodes and '_' in entry.name:
+                    batch_nodes[file_ending].add(entry.name.split('_')[2])
+
     for batch in batches:
-        node_list = []
-        for measurement_type in measurement_types:
-            data_files = os.listdir(data_dir[measurement_type])
-            data_files = sorted([f for f in data_files if f.endswith('_' + str(batch) + '.npy')])
-            for file in data_files:
-                node_id = file.split('_')
-                node_id = node_id[2]
-                node_list.append(node_id) if node_id not in node_list else node_list
+        node_list = batch_nodes[str(batch) + '.npy']
 
         if node_count <= len(node_list):
             if node_count == len(node_list):
@@ -127,13 +128,12 @@ def count_wrong_signs(measurement_df, measurement_type='load'):
         Returns:
             int: with the number of samples with wrong signage
     """
+    values = measurement_df.to_numpy()
     if measurement_type == "load":
-        negative_values = measurement_df.lt(0).sum().sum()
-        return int(negative_values)
+        return int((values < 0).sum())
     if measurement_type == "solar":
-        positive_values = measurement_df.gt(0).sum()
-        return int(positive_values)
-    return 0
+        return int((values > 0).sum())
+    raise ValueError("Unknown measurement type: %s" % measurement_type)
 
 
 def get_time_range(measurement_df):
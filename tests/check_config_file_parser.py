@@ -0,0 +1,84 @@
+from c3x.data_loaders import configfileparser
+import configparser
+import datetime
+import os
+
+CONFIG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scripts", "config")
+
+
+def test_read_time_filters():
+    config = configfileparser.ConfigFileParser(os.path.join(CONFIG_DIR, "example_full_config.ini"))
+
+    time_filter = config.read_time_filters()
+
+    assert isinstance(time_filter["time_filter_use"], bool), "time_filter_use was not typecasted"
+    if time_filter["time_filter_use"]:
+        assert isinstance(time_filter["start_time"], datetime.datetime), \
+            "start_time was not converted"
+        assert isinstance(time_filter["end_time"], datetime.datetime), "end_time was not converted"
+
+def test_read_all():
+    config = configfileparser.ConfigFileParser(os.path.join(CONFIG_DIR, "example_full_config.ini"))
+
+    config_dict = config.read_all()
+
+    assert config_dict["batches"] == config.read_batches(), "batches differ from read_batches"
+    assert config_dict["data_usage"] == config.read_data_usage(), \
+        "data usage differs from read_data_usage"
+    assert config_dict["inverter"] == config.read_inverter(), "inverter differs from read_inverter"
+
+def test_read_all_without_required_sections():
+    config = configfileparser.ConfigFileParser(os.path.join(CONFIG_DIR, "example_for_cleaning.ini"))
+
+    config_dict = config.read_all()
+
+    assert "batches" in config_dict, "batches are missing"
+    assert "inverter" not in config_dict, "missing inverter section was returned"
+
+def test_sections_are_read_only():
+    config = configfileparser.ConfigFileParser(os.path.join(CONFIG_DIR, "example_full_config.ini"))
+
+    batches = config.read_batches()
+
+    try:
+        batches["number_of_batches"] = 0
+    except TypeError:
+        pass
+    else:
+        assert False, "section could be modified"
+
+def test_read_data_usage_returns_new_list():
+    config = configfileparser.ConfigFileParser(os.path.join(CONFIG_DIR, "example_full_config.ini"))
+
+    measurement_types = config.read_data_usage()
+    measurement_types.append("unknown")
+
+    assert "unknown" not in config.read_data_usage(), "data usage list is shared between calls"
+
+def test_duplicate_keys_and_empty_lines(tmp_path):
+    ini_path = tmp_path / "config.ini"
+    ini_path.write_text("[Scenario]\nname = a\nname = b\n")
+
+    try:
+        configfileparser.ConfigFileParser(str(ini_path))
+    except configparser.DuplicateOptionError:
+        pass
+    else:
+        assert False, "repeated key was not rejected"
+
+    ini_path.write_text("[Scenario]\nname = a\n\n  b\n\n[Batches]\nfiles_per_batch = 1\n")
+
+    scenario = configfileparser.ConfigFileParser(str(ini_path)).read_scenario_info()
+
+    assert scenario["name"] == "a\n\nb", "empty line in multiline value was dropped"
+
+def test_read_all_raises_for_broken_sections(tmp_path):
+    ini_path = tmp_path / "config.ini"
+    ini_path.write_text("[Time Filter]\ntime_filter_use = True\nend_time = 2018-12-31 23:59\n")
+
+    try:
+        configfileparser.ConfigFileParser(str(ini_path)).read_all()
+    except KeyError:
+        pass
+    else:
+        assert False, "missing start_time was not reported"
@@ -0,0 +1,19 @@
+import pandas
+from c3x.data_statistics import figure_of_merit
+
+
+def test_peak_power_indices():
+    """
+    Test that import and export peaks are reported at their own timestamps.
+    """
+
+    index = pandas.date_range("2019-01-22 00:00", periods=4, freq="5min")
+    meas_dict = {"1": {"loads_1": pandas.DataFrame({"power": [1.0, 4.0, -2.0, 0.5]}, index=index)},
+                 "2": {"loads_2": pandas.DataFrame({"power": [0.5, 1.0, -3.0, 0.5]}, index=index)}}
+
+    peaks = figure_of_merit.peak_powers(meas_dict)
+
+    assert peaks["peak_power_import"] == 5.0, "import peak is wrong"
+    assert peaks["peak_power_export"] == -5.0, "export peak is wrong"
+    assert peaks["peak_power_import_index"] == index[1], "import peak index is wrong"
+    assert peaks["peak_power_export_index"] == index[2], "export peak index is wrong"
@@ -0,0 +1,30 @@
+import pandas
+from c3x.data_statistics import statistics
+
+
+def test_count_wrong_signs():
+    """
+    Test that negative loads and positive solar values are counted.
+    """
+
+    dataframe = pandas.DataFrame({"A": [1.0, -2.0, 3.0], "B": [-1.0, 0.0, 2.0]})
+
+    assert statistics.count_wrong_signs(dataframe, measurement_type="load") == 2, \
+        "negative loads have not been counted"
+    assert statistics.count_wrong_signs(dataframe, measurement_type="solar") == 3, \
+        "positive solar values have not been counted"
+
+
+def test_count_wrong_signs_unknown_type():
+    """
+    Test that an unknown measurement type is rejected.
+    """
+
+    dataframe = pandas.DataFrame({"A": [1.0, -2.0, 3.0]})
+
+    try:
+        statistics.count_wrong_signs(dataframe, measurement_type="battery")
+    except ValueError:
+        pass
+    else:
+        assert False, "unknown measurement type was accepted"